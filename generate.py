@@ -13,21 +13,154 @@ Generates CSV files for:
 
 import os
 import json
-import random
+import multiprocessing
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from faker import Faker
+from numba import njit, prange
 
 fake = Faker()
 
+
+def _seed_worker(rng: np.random.Generator):
+    """Seed the worker's shared Faker state from the shard's generator."""
+    Faker.seed(int(rng.integers(2**32)))
+
+
+# Rows per shard. Fixed, so the shard layout (and the data) depends only on the
+# seed and not on how many workers the pool happens to have.
+_SHARD_SIZE = 1000
+# Fewer shards than this run inline; starting spawn workers would cost more than it saves
+_MIN_POOL_SHARDS = 4
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on; cpu_count() reports host cores inside CPU-limited containers."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _shard_bounds(n_items: int, shard_size: int = _SHARD_SIZE) -> List[Tuple[int, int]]:
+    """Split range(n_items) into contiguous (start, count) chunks of shard_size rows."""
+    if n_items == 0:
+        return [(0, 0)]
+    return [(start, min(shard_size, n_items - start)) for start in range(0, n_items, shard_size)]
+
+
+def _format_ids(prefix: str, numbers: np.ndarray, width: int) -> np.ndarray:
+    """prefix + zero-padded numbers, e.g. ('txn_', [1], 7) -> ['txn_0000001']."""
+    if len(numbers) == 0:
+        # np.char.zfill cannot size its output for an empty array
+        return np.array([], dtype=str)
+    return np.char.add(prefix, np.char.zfill(numbers.astype(str), width))
+
+
+# Shard workers live at module level so multiprocessing can pickle them; each one
+# draws from its own spawned Generator instead of state inherited from the parent.
+def _gen_user_shard(args: Tuple[int, int, np.random.Generator]) -> pd.DataFrame:
+    start_idx, count, rng = args
+    _seed_worker(rng)
+    return pd.DataFrame({
+        'user_id': [f'user_{i+1:05d}' for i in range(start_idx, start_idx + count)],
+        'first_name': [fake.first_name() for _ in range(count)],
+        'last_name': [fake.last_name() for _ in range(count)],
+        'email': [fake.safe_email() for _ in range(count)],
+        'phone': [fake.phone_number() for _ in range(count)],
+        'date_of_birth': [fake.date_of_birth(minimum_age=18, maximum_age=80).isoformat() for _ in range(count)],
+        'address': [fake.street_address() for _ in range(count)],
+        'city': [fake.city() for _ in range(count)],
+        'state': [fake.state() for _ in range(count)],
+        'country': 'USA',
+        'postal_code': [fake.zipcode() for _ in range(count)],
+        'registration_date': [fake.date_time_between(start_date='-2y', end_date='now').isoformat() for _ in range(count)],
+        'is_active': rng.random(count) > 0.25,
+        'risk_score': rng.beta(2, 5, size=count)
+    })
+
+
+def _gen_card_shard(args: Tuple[List[str], List[str], np.random.Generator]) -> pd.DataFrame:
+    user_ids, card_types, rng = args
+    _seed_worker(rng)
+    n_cards = rng.choice([1,2,3], size=len(user_ids), p=[0.6,0.3,0.1])
+    total = int(n_cards.sum())
+    owners = np.repeat(np.array(user_ids, dtype=str), n_cards)
+    # 1-based position of each card within its owner's run
+    seq = np.arange(total) - np.repeat(np.cumsum(n_cards) - n_cards, n_cards) + 1
+    card_ids = np.char.add(np.char.add('card_', owners), _format_ids('_', seq, 2))
+    issuers = np.array(['Chase Bank','Bank of America','Wells Fargo','Citi Bank','Capital One'], dtype=object)
+    card_types = np.array(card_types, dtype=object)
+    credit_limit = rng.choice([5000,10000,15000,20000,25000,50000], size=total)
+    return pd.DataFrame({
+        'card_id': card_ids,
+        'user_id': owners,
+        'card_number': np.char.add('****', rng.integers(1000, 10000, total).astype(str)),
+        'card_type': card_types[rng.integers(0, len(card_types), total)],
+        'issuer': issuers[rng.integers(0, len(issuers), total)],
+        'expiry_date': [fake.future_date(end_date='+5y').isoformat() for _ in range(total)],
+        'is_active': rng.random(total) > 0.25,
+        'credit_limit': credit_limit,
+        'current_balance': np.round(rng.uniform(0, 0.8, total) * credit_limit, 2)
+    })
+
+
+def _gen_merchant_shard(args: Tuple[int, int, List[str], np.random.Generator]) -> pd.DataFrame:
+    start_idx, count, categories, rng = args
+    _seed_worker(rng)
+    return pd.DataFrame({
+        'merchant_id': [f'merchant_{i+1:05d}' for i in range(start_idx, start_idx + count)],
+        'merchant_name': [fake.company() for _ in range(count)],
+        'merchant_category': pd.Categorical.from_codes(rng.integers(0, len(categories), count), categories),
+        'merchant_category_code': np.char.add('MCC_', rng.integers(1000, 10000, count).astype(str)),
+        'address': [fake.street_address() for _ in range(count)],
+        'city': [fake.city() for _ in range(count)],
+        'state': [fake.state() for _ in range(count)],
+        'country': 'USA',
+        'postal_code': [fake.zipcode() for _ in range(count)],
+        'is_active': rng.random(count) > 0.25,
+        'risk_score': rng.beta(2, 5, size=count)
+    })
+
+
+# Explicit signature + cache=True: compiled once, then loaded from __pycache__ on later runs
+@njit('float64[:](float64[:], int8[:], int8[:], bool_[:], float64[:], float64[:], bool_[:], float64[:])',
+      cache=True, parallel=True, fastmath=True)
+def _fraud_probs(amount, hour, weekday, loc_high, cat_rate, user_risk, is_fraud, noise):
+    out = np.empty_like(amount)
+    for i in prange(len(amount)):
+        p = 0.0
+        if amount[i] > 10000:
+            p += 0.3
+        elif amount[i] > 5000:
+            p += 0.2
+        elif amount[i] > 1000:
+            p += 0.1
+        if hour[i] >= 22 or hour[i] < 6:
+            p += 0.15
+        if weekday[i] >= 5:
+            p += 0.1
+        if loc_high[i]:
+            p += 0.2
+        p += cat_rate[i] * 2
+        p += user_risk[i] * 0.3
+        p += noise[i]
+        p = max(0.0, min(1.0, p))
+        if is_fraud[i]:
+            p = max(p, 0.5)
+        out[i] = p
+    return out
+
+
 class TransactionDataGenerator:
-    def __init__(self, seed: int = 42):
-        np.random.seed(seed)
-        random.seed(seed)
-        Faker.seed(seed)
+    def __init__(self, seed: int = 42, n_workers: Optional[int] = None):
+        self.rng = np.random.default_rng(seed)
+        self.n_workers = n_workers or _available_cpus()
+        self._pool = None
 
         self.merchant_categories = {
             'grocery': {'fraud_rate': 0.01, 'avg_amount': 85.50},
@@ -46,6 +179,10 @@ class TransactionDataGenerator:
             'adult_entertainment': {'fraud_rate': 0.06, 'avg_amount': 75.00},
             'gambling': {'fraud_rate': 0.10, 'avg_amount': 200.00}
         }
+        # Category code i (merchant_category.cat.codes) indexes these arrays
+        self._cat_names = list(self.merchant_categories.keys())
+        self._cat_rate = np.array([v['fraud_rate'] for v in self.merchant_categories.values()])
+        self._cat_avg = np.array([v['avg_amount'] for v in self.merchant_categories.values()])
 
         self.high_risk_locations = [
             'Miami, FL', 'Las Vegas, NV', 'Atlantic City, NJ',
@@ -57,232 +194,217 @@ class TransactionDataGenerator:
             'Dallas, TX', 'Houston, TX', 'Atlanta, GA', 'Nashville, TN'
         ]
         self.device_types = ['mobile', 'desktop', 'tablet', 'pos_terminal']
+        self.source_systems = ['mobile_app', 'web_portal', 'pos_terminal', 'api']
         self.card_types = ['Visa', 'MasterCard', 'American Express', 'Discover']
 
-    def generate_users(self, n_users: int = 1000) -> List[Dict[str, Any]]:
-        users = []
-        for i in range(n_users):
-            users.append({
-                'user_id': f'user_{i+1:05d}',
-                'first_name': fake.first_name(),
-                'last_name': fake.last_name(),
-                'email': fake.safe_email(),
-                'phone': fake.phone_number(),
-                'date_of_birth': fake.date_of_birth(minimum_age=18, maximum_age=80).isoformat(),
-                'address': fake.street_address(),
-                'city': fake.city(),
-                'state': fake.state(),
-                'country': 'USA',
-                'postal_code': fake.zipcode(),
-                'registration_date': fake.date_time_between(start_date='-2y', end_date='now').isoformat(),
-                'is_active': random.choice([True, True, True, False]),
-                'risk_score': float(np.random.beta(2, 5))
-            })
-        return users
-
-    def generate_cards(self, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        cards = []
-        for user in users:
-            n_cards = random.choices([1,2,3], weights=[0.6,0.3,0.1])[0]
-            for c in range(n_cards):
-                credit_limit = random.choice([5000,10000,15000,20000,25000,50000])
-                cards.append({
-                    'card_id': f'card_{user["user_id"]}_{c+1:02d}',
-                    'user_id': user['user_id'],
-                    'card_number': f'****{random.randint(1000,9999)}',
-                    'card_type': random.choice(self.card_types),
-                    'issuer': random.choice(['Chase Bank','Bank of America','Wells Fargo','Citi Bank','Capital One']),
-                    'expiry_date': fake.future_date(end_date='+5y').isoformat(),
-                    'is_active': random.choice([True,True,True,False]),
-                    'credit_limit': credit_limit,
-                    'current_balance': round(random.uniform(0,0.8) * credit_limit,2)
-                })
-        return cards
-
-    def generate_merchants(self, n_merchants: int = 500) -> List[Dict[str, Any]]:
-        merchants = []
-        for i in range(n_merchants):
-            category = random.choice(list(self.merchant_categories.keys()))
-            merchants.append({
-                'merchant_id': f'merchant_{i+1:05d}',
-                'merchant_name': fake.company(),
-                'merchant_category': category,
-                'merchant_category_code': f'MCC_{random.randint(1000,9999)}',
-                'address': fake.street_address(),
-                'city': fake.city(),
-                'state': fake.state(),
-                'country': 'USA',
-                'postal_code': fake.zipcode(),
-                'is_active': random.choice([True, True, True, False]),
-                'risk_score': float(np.random.beta(2,5))
-            })
-        return merchants
-
-    def _calculate_fraud_probability(self, amount: float, transaction_time: datetime,
-                                     location: str, merchant_category: str,
-                                     user_risk_score: float, is_fraud: bool) -> float:
-        probability = 0.0
-        if amount > 10000:
-            probability += 0.3
-        elif amount > 5000:
-            probability += 0.2
-        elif amount > 1000:
-            probability += 0.1
-        if transaction_time.hour >= 22 or transaction_time.hour < 6:
-            probability += 0.15
-        if transaction_time.weekday() >= 5:
-            probability += 0.1
-        if location in self.high_risk_locations:
-            probability += 0.2
-        category_info = self.merchant_categories[merchant_category]
-        probability += category_info['fraud_rate'] * 2
-        probability += user_risk_score * 0.3
-        probability += random.uniform(-0.1, 0.1)
-        probability = max(0.0, min(1.0, probability))
-        if is_fraud:
-            probability = max(probability, 0.5)
-        return probability
-
-    def generate_transactions(self, users, cards, merchants,
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the shard worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _map_shards(self, worker, shard_args: List[tuple]) -> list:
+        if self.n_workers == 1 or len(shard_args) < _MIN_POOL_SHARDS:
+            return [worker(args) for args in shard_args]
+        if self._pool is None:
+            # spawn, not fork: the eagerly compiled parallel kernel has already set up
+            # Numba's threading layer in this process, which a forked child can deadlock on.
+            # Spawned workers pay a full module import, so the pool is started once and
+            # reused by every generator until close(). It is sized to the first shard list
+            # (users, the largest in save_csvs) since every spawned worker starts up front.
+            self._pool = multiprocessing.get_context('spawn').Pool(min(self.n_workers, len(shard_args)))
+        return self._pool.map(worker, shard_args)
+
+    def _spawn_shards(self, n_items: int) -> List[Tuple[int, int, np.random.Generator]]:
+        """Fixed shard bounds for n_items, each paired with its own child generator."""
+        bounds = _shard_bounds(n_items)
+        return [(start, count, rng) for (start, count), rng in zip(bounds, self.rng.spawn(len(bounds)))]
+
+    def generate_users(self, n_users: int = 1000) -> pd.DataFrame:
+        shard_args = self._spawn_shards(n_users)
+        users = pd.concat(self._map_shards(_gen_user_shard, shard_args), ignore_index=True)
+        return users.astype({'country': 'category'})
+
+    def generate_cards(self, users: pd.DataFrame) -> pd.DataFrame:
+        user_ids = users['user_id'].tolist()
+        shard_args = [(user_ids[start:start + count], self.card_types, rng)
+                      for start, count, rng in self._spawn_shards(len(user_ids))]
+        cards = pd.concat(self._map_shards(_gen_card_shard, shard_args), ignore_index=True)
+        return cards.astype({'card_type': 'category', 'issuer': 'category'})
+
+    def generate_merchants(self, n_merchants: int = 500) -> pd.DataFrame:
+        shard_args = [(start, count, self._cat_names, rng)
+                      for start, count, rng in self._spawn_shards(n_merchants)]
+        merchants = pd.concat(self._map_shards(_gen_merchant_shard, shard_args), ignore_index=True)
+        return merchants.astype({'country': 'category'})
+
+    def generate_transactions(self, users: pd.DataFrame, cards: pd.DataFrame,
+                              merchants: pd.DataFrame,
                               n_transactions: int = 50000,
                               start_date: datetime = None,
-                              end_date: datetime = None) -> List[Dict[str, Any]]:
+                              end_date: datetime = None) -> pd.DataFrame:
         if start_date is None:
             start_date = datetime.now() - timedelta(days=90)
         if end_date is None:
             end_date = datetime.now()
 
-        transactions = []
-        last_tx_time_by_card = {}
-
-        i = 0
-        attempts = 0
-        while i < n_transactions and attempts < n_transactions * 3:
-            attempts += 1
-            user = random.choice(users)
-            user_cards = [c for c in cards if c['user_id'] == user['user_id'] and c['is_active']]
-            if not user_cards:
-                continue
-            card = random.choice(user_cards)
-            merchant = random.choice(merchants)
-
-            transaction_time = fake.date_time_between(start_date=start_date, end_date=end_date)
-
-            category_info = self.merchant_categories[merchant['merchant_category']]
-            base_fraud_rate = category_info['fraud_rate']
-            user_fraud_rate = base_fraud_rate * (1 + user['risk_score'])
-            if transaction_time.hour >= 22 or transaction_time.hour < 6:
-                user_fraud_rate *= 1.5
-            if transaction_time.weekday() >= 5:
-                user_fraud_rate *= 1.2
-            if merchant['city'] in ['Miami', 'Las Vegas', 'Atlantic City']:
-                user_fraud_rate *= 1.3
-
-            is_fraud = random.random() < user_fraud_rate
-
-            if is_fraud:
-                amount = np.random.lognormal(mean=np.log(category_info['avg_amount']*2), sigma=0.8)
-                amount = min(amount, 50000)
-            else:
-                amount = np.random.lognormal(mean=np.log(category_info['avg_amount']), sigma=0.6)
-                amount = min(amount, 5000)
-
-            if is_fraud and random.random() < 0.3:
-                location = random.choice(self.high_risk_locations)
-            else:
-                location = random.choice(self.normal_locations)
-
-            device_type = random.choice(self.device_types)
-            device_id = f'device_{random.randint(1000,9999)}'
-
-            prev_time = last_tx_time_by_card.get(card['card_id'])
-            if prev_time:
-                seconds_since = (transaction_time - prev_time).total_seconds()
-            else:
-                seconds_since = None
-            last_tx_time_by_card[card['card_id']] = transaction_time
-
-            fraud_probability = round(self._calculate_fraud_probability(
-                amount, transaction_time, location, merchant['merchant_category'],
-                user['risk_score'], is_fraud), 4)
-
-            txn = {
-                'transaction_id': f'txn_{i+1:07d}',
-                'card_id': card['card_id'],
-                'card_number': card['card_number'],
-                'user_id': user['user_id'],
-                'merchant_id': merchant['merchant_id'],
-                'merchant_name': merchant['merchant_name'],
-                'merchant_category': merchant['merchant_category'],
-                'amount': round(float(amount),2),
-                'currency': 'USD',
-                'transaction_time': transaction_time.isoformat(),
-                'location': location,
-                'latitude': round(float(fake.latitude()),6),
-                'longitude': round(float(fake.longitude()),6),
-                'device_id': device_id,
-                'device_type': device_type,
-                'source_system': random.choice(['mobile_app','web_portal','pos_terminal','api']),
-                'seconds_since_prev_tx': seconds_since,
-                'is_fraud': is_fraud,
-                'fraud_probability': fraud_probability,
-                'created_at': transaction_time.isoformat()
-            }
-
-            transactions.append(txn)
-            i += 1
-
-        return transactions
-
-    def generate_fraud_alerts(self, transactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        alerts = []
-        for tx in transactions:
-            if tx['fraud_probability'] > 0.5:
-                alerts.append({
-                    'alert_id': f'alert_{tx["transaction_id"]}',
-                    'transaction_id': tx['transaction_id'],
-                    'user_id': tx['user_id'],
-                    'fraud_probability': tx['fraud_probability'],
-                    'risk_level': 'high' if tx['fraud_probability'] > 0.8 else 'medium',
-                    'alert_type': 'automatic_fraud_detection',
-                    'description': f'Transaction flagged as { "high" if tx["fraud_probability"] > 0.8 else "medium" } risk fraud',
-                    'status': random.choice(['pending','reviewed','resolved']),
-                    'created_at': tx['transaction_time']
-                })
-        return alerts
+        # Active cards grouped by owner: owner k's cards are rows
+        # first_card[k] .. first_card[k] + n_user_cards[k] - 1
+        active_cards = cards[cards['is_active']].sort_values('user_id', kind='stable')
+        users_with_cards, first_card, n_user_cards = np.unique(
+            active_cards['user_id'].to_numpy(), return_index=True, return_counts=True)
+        risk_by_user = users.set_index('user_id')['risk_score'].reindex(users_with_cards).to_numpy()
+        # Nobody to transact: fall through with n = 0 so the result still has every column
+        n = n_transactions if len(users_with_cards) else 0
+
+        merchant_cat_idx = pd.Categorical(merchants['merchant_category'], categories=self._cat_names).codes
+        merchant_high_risk = merchants['city'].isin(['Miami', 'Las Vegas', 'Atlantic City']).to_numpy()
+
+        u_idx = self.rng.integers(0, len(users_with_cards), n)
+        user_ids = users_with_cards[u_idx]
+        user_risk = risk_by_user[u_idx]
+        card_idx = first_card[u_idx] + self.rng.integers(0, n_user_cards[u_idx])
+        m_idx = self.rng.integers(0, len(merchants), n)
+        cat_idx = merchant_cat_idx[m_idx]
+
+        # Wall-clock seconds, so the naive start/end dates are not shifted to UTC
+        start_ts = np.datetime64(start_date, 's').astype(np.int64)
+        end_ts = np.datetime64(end_date, 's').astype(np.int64)
+        ts = self.rng.integers(start_ts, end_ts, size=n, dtype=np.int64)
+        transaction_times = pd.to_datetime(ts, unit='s')
+        hour = transaction_times.hour.values.astype(np.int8)
+        weekday = transaction_times.weekday.values.astype(np.int8)
+        night = (hour >= 22) | (hour < 6)
+        weekend = weekday >= 5
+
+        user_fraud_rate = self._cat_rate[cat_idx] * (1 + user_risk)
+        user_fraud_rate *= np.where(night, 1.5, 1.0)
+        user_fraud_rate *= np.where(weekend, 1.2, 1.0)
+        user_fraud_rate *= np.where(merchant_high_risk[m_idx], 1.3, 1.0)
+        is_fraud = self.rng.random(n) < user_fraud_rate
+
+        avg_amount = self._cat_avg[cat_idx]
+        amount = np.where(
+            is_fraud,
+            self.rng.lognormal(mean=np.log(avg_amount * 2), sigma=0.8).clip(max=50000),
+            self.rng.lognormal(mean=np.log(avg_amount), sigma=0.6).clip(max=5000))
+
+        # Categorical columns are built straight from their sampled codes, so
+        # the frame needs no astype pass afterwards
+        loc_high = is_fraud & (self.rng.random(n) < 0.3)
+        n_high = len(self.high_risk_locations)
+        location = pd.Categorical.from_codes(
+            np.where(loc_high,
+                     self.rng.integers(0, n_high, n),
+                     n_high + self.rng.integers(0, len(self.normal_locations), n)),
+            self.high_risk_locations + self.normal_locations)
+        device_type = pd.Categorical.from_codes(
+            self.rng.integers(0, len(self.device_types), n), self.device_types)
+        source_system = pd.Categorical.from_codes(
+            self.rng.integers(0, len(self.source_systems), n), self.source_systems)
+        latitude = np.round(self.rng.uniform(-90, 90, n), 6)
+        longitude = np.round(self.rng.uniform(-180, 180, n), 6)
+        device_id = np.char.add('device_', self.rng.integers(1000, 10000, n).astype(str))
+        card_ids = active_cards['card_id'].to_numpy()[card_idx]
+
+        # Gap to the card's previous transaction in time, in whole seconds (nullable
+        # Int64 so the CSV column is typed as integer); the index keeps the original
+        # row order when the diff is put back
+        seconds_since = (pd.DataFrame({'card': card_idx, 'ts': ts})
+                         .sort_values(['card', 'ts'])
+                         .groupby('card')['ts'].diff()
+                         .sort_index()
+                         .astype('Int64')
+                         .array)
+
+        fraud_probability = _fraud_probs(
+            amount, hour, weekday, loc_high,
+            self._cat_rate[cat_idx], user_risk, is_fraud,
+            self.rng.uniform(-0.1, 0.1, n)).round(4)
+        iso_times = transaction_times.strftime('%Y-%m-%dT%H:%M:%S')
+
+        return pd.DataFrame({
+            'transaction_id': _format_ids('txn_', np.arange(1, n + 1), 7),
+            'card_id': card_ids,
+            'card_number': active_cards['card_number'].to_numpy()[card_idx],
+            'user_id': user_ids,
+            'merchant_id': merchants['merchant_id'].to_numpy()[m_idx],
+            'merchant_name': merchants['merchant_name'].to_numpy()[m_idx],
+            'merchant_category': pd.Categorical.from_codes(cat_idx, self._cat_names),
+            'amount': amount.round(2),
+            'currency': pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), ['USD']),
+            'transaction_time': iso_times,
+            'location': location,
+            'latitude': latitude,
+            'longitude': longitude,
+            'device_id': device_id,
+            'device_type': device_type,
+            'source_system': source_system,
+            'seconds_since_prev_tx': seconds_since,
+            'is_fraud': is_fraud,
+            'fraud_probability': fraud_probability,
+            'created_at': iso_times
+        })
+
+    def generate_fraud_alerts(self, transactions: pd.DataFrame) -> pd.DataFrame:
+        flagged = transactions[transactions['fraud_probability'] > 0.5]
+        risk_level = np.where(flagged['fraud_probability'] > 0.8, 'high', 'medium')
+        return pd.DataFrame({
+            'alert_id': ('alert_' + flagged['transaction_id']).to_numpy(),
+            'transaction_id': flagged['transaction_id'].to_numpy(),
+            'user_id': flagged['user_id'].to_numpy(),
+            'fraud_probability': flagged['fraud_probability'].to_numpy(),
+            'risk_level': risk_level,
+            'alert_type': 'automatic_fraud_detection',
+            'description': np.char.add(np.char.add('Transaction flagged as ', risk_level), ' risk fraud'),
+            'status': self.rng.choice(['pending','reviewed','resolved'], size=len(flagged)),
+            'created_at': flagged['transaction_time'].to_numpy()
+        })
+
+def _write_csv(df: pd.DataFrame, path: str):
+    """Write df through Arrow's multithreaded CSV writer instead of DataFrame.to_csv.
+
+    Unlike to_csv, Arrow quotes every string value, writes booleans as true/false
+    and prints integral floats without a trailing '.0' (54.0 -> 54). Columns that
+    are whole numbers by nature should therefore carry an integer dtype.
+    """
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
 
 def save_csvs(output_dir: str = 'sample-data',
               n_users: int = 1000,
               n_merchants: int = 500,
               n_transactions: int = 50000):
     os.makedirs(output_dir, exist_ok=True)
-    gen = TransactionDataGenerator(seed=42)
-
-    print("Generating users...")
-    users = gen.generate_users(n_users)
-    print("Generating cards...")
-    cards = gen.generate_cards(users)
-    print("Generating merchants...")
-    merchants = gen.generate_merchants(n_merchants)
-    print("Generating transactions...")
-    transactions = gen.generate_transactions(users, cards, merchants, n_transactions)
-    print("Generating fraud alerts...")
-    alerts = gen.generate_fraud_alerts(transactions)
-
-    tx_df = pd.DataFrame(transactions)
-    points_agg = tx_df.groupby('user_id')['amount'].sum().reset_index().rename(columns={'amount':'total_spent'})
-    points_agg['points'] = (points_agg['total_spent'] / 10).astype(int)
-    users_df = pd.DataFrame(users)
-    points_df = points_agg.merge(users_df[['user_id','risk_score']], on='user_id', how='left')
-    points_df['points'] = (points_df['points'] + (points_df['risk_score'] * 10).fillna(0)).astype(int)
-    points_df = points_df[['user_id','total_spent','points']]
-
-    pd.DataFrame(users).to_csv(os.path.join(output_dir,'users.csv'), index=False)
-    pd.DataFrame(cards).to_csv(os.path.join(output_dir,'cards.csv'), index=False)
-    pd.DataFrame(merchants).to_csv(os.path.join(output_dir,'merchants.csv'), index=False)
-    tx_df.to_csv(os.path.join(output_dir,'transactions.csv'), index=False)
-    pd.DataFrame(alerts).to_csv(os.path.join(output_dir,'fraud_alerts.csv'), index=False)
-    points_df.to_csv(os.path.join(output_dir,'points.csv'), index=False)
+    with TransactionDataGenerator(seed=42) as gen:
+        print("Generating users...")
+        users = gen.generate_users(n_users)
+        print("Generating cards...")
+        cards = gen.generate_cards(users)
+        print("Generating merchants...")
+        merchants = gen.generate_merchants(n_merchants)
+        print("Generating transactions...")
+        transactions = gen.generate_transactions(users, cards, merchants, n_transactions)
+        print("Generating fraud alerts...")
+        alerts = gen.generate_fraud_alerts(transactions)
+
+    points_agg = transactions.groupby('user_id', observed=True)['amount'].sum().reset_index().rename(columns={'amount':'total_spent'})
+    risk = pd.Series(users['risk_score'].to_numpy(), index=users['user_id'].to_numpy())
+    points_agg['points'] = ((points_agg['total_spent'] / 10).astype(int)
+                            + (points_agg['user_id'].map(risk) * 10).fillna(0)).astype(int)
+
+    _write_csv(users, os.path.join(output_dir,'users.csv'))
+    _write_csv(cards, os.path.join(output_dir,'cards.csv'))
+    _write_csv(merchants, os.path.join(output_dir,'merchants.csv'))
+    _write_csv(transactions, os.path.join(output_dir,'transactions.csv'))
+    _write_csv(alerts, os.path.join(output_dir,'fraud_alerts.csv'))
+    _write_csv(points_agg, os.path.join(output_dir,'points.csv'))
 
     print("Saved CSV files to", output_dir)
     print(f"Users: {len(users)} | Cards: {len(cards)} | Merchants: {len(merchants)} | Transactions: {len(transactions)} | Alerts: {len(alerts)}")